@@ -1,13 +1,27 @@
-import heapq
 import networkx as nx
 import matplotlib.pyplot as plt
-import random
+import numpy as np
+from numba import njit, prange
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import dijkstra as sp_dijkstra
+
+try:
+    import cupy as cp
+except ImportError:
+    cp = None  # GPU version unavailable, everything else still works
 
 n = 8
+MAX_WEIGHT = 10
 
-matrix = [[0 if i == j or random.random() > 0.23 else random.randint(1, 10) for j in range(n)] for i in range(n)]
-matrix[0][random.randint(1, n-1)] = random.randint(1, 10)
-edges = [(i, j, matrix[i][j]) for i in range(n) for j in range(n) if matrix[i][j] != 0]
+# Whole-matrix construction: one random draw per cell instead of n^2 python
+# calls, then the edge list falls out of a single nonzero scan.
+rng = np.random.default_rng()
+mask = rng.random((n, n)) <= 0.23
+matrix = np.where(mask, rng.integers(1, MAX_WEIGHT + 1, size=(n, n)), 0)
+np.fill_diagonal(matrix, 0)
+matrix[0, rng.integers(1, n)] = rng.integers(1, MAX_WEIGHT + 1)  # node 0 always has an out-edge
+rows, cols = np.nonzero(matrix)
+edges = np.column_stack([rows, cols, matrix[rows, cols]])
 
 print("Adjacency Matrix:")
 for row in matrix:
@@ -15,64 +29,326 @@ for row in matrix:
 
 print("\nEdges with weights:")
 print(edges)
-distance_vector = [float("inf")] * len(matrix)
-distance_vector[0] = 0 
 
-def distance(matrix, i, j):
-    return matrix[i][j] if matrix[i][j] != 0 else None
+def build_csr(edges, n):
+    # CSR layout: the neighbours of u live in indices[indptr[u]:indptr[u+1]],
+    # with their weights in the matching slice of weights. Built once from the
+    # edge list so the main loop only touches the out-edges of a node instead
+    # of rescanning a whole matrix row.
+    indptr = np.zeros(n + 1, dtype=np.int32)
+    for i, j, w in edges:
+        indptr[i + 1] += 1
+    np.cumsum(indptr, out=indptr)
+    indices = np.empty(len(edges), dtype=np.int32)
+    weights = np.empty(len(edges), dtype=np.float64)
+    cursor = indptr[:-1].copy()
+    for i, j, w in edges:
+        indices[cursor[i]] = j
+        weights[cursor[i]] = w
+        cursor[i] += 1
+    return indptr, indices, weights
+
+indptr, indices, weights = build_csr(edges, n)
 
-def neighbours(matrix, i):
-    return [j for j in range(len(matrix)) if distance(matrix, i, j) is not None]
+distance_vector = [float("inf")] * n
+distance_vector[0] = 0
 
-def dijkstra(matrix, distance_vector):
+def dijkstra(indptr, indices, weights, distance_vector):
 
-    visited = set()
-    heap = [(0, 0)]  # (distance, vertex)
-    previous = [None] * len(matrix)
+    # Dial's bucket queue: weights are small integers (1..MAX_WEIGHT), so every
+    # tentative distance fits in [0, MAX_WEIGHT*(n-1)] and extract-min is a
+    # monotone scan over buckets instead of a log n heap operation.
+    n = len(distance_vector)
+    # Flat arrays instead of a set and a list of None: visited[u] is a plain
+    # array load and -1 marks "no predecessor", so no hashing or is-None
+    # checks inside the loop.
+    visited = np.zeros(n, dtype=np.uint8)
+    previous = np.full(n, -1, dtype=np.int32)
+    buckets = [[] for _ in range(MAX_WEIGHT * n + 1)]
+    buckets[0].append(0)
+    cur_bucket = 0
 
-    while heap:
-        current_dist, u = heapq.heappop(heap)
+    while cur_bucket < len(buckets):
+        if not buckets[cur_bucket]:
+            cur_bucket += 1
+            continue
+        u = buckets[cur_bucket].pop()
 
-        if u in visited:
+        if visited[u]:
             continue
-        visited.add(u)
+        visited[u] = 1
+        current_dist = cur_bucket
 
         print(f"\nVisiting vertex {u}, current distance: {current_dist}")
-        
-        for v in neighbours(matrix, u):
-            if v in visited:
+
+        for k in range(indptr[u], indptr[u + 1]):
+            v = int(indices[k])
+            if visited[v]:
                 continue
-            alt = current_dist + distance(matrix, u, v)
+            alt = current_dist + int(weights[k])
             if alt < distance_vector[v]:
                 distance_vector[v] = alt
                 previous[v] = u
-                heapq.heappush(heap, (alt, v))
+                buckets[alt].append(v)
                 print(f" -> Updated distance to vertex {v}: {alt}")
-    
+
     print("\nShortest paths from node 0:")
-    for target in range(len(matrix)):
+    paths = reconstruct_paths(previous)
+    for target in range(n):
         if distance_vector[target] == float('inf'):
             print(f"Node {target} is unreachable from node 0")
             continue
 
-        path = []
-        current = target
-        while current is not None:
-            path.append(current)
-            current = previous[current]
-        path.reverse()
+        path = paths[target][paths[target] != -1][::-1].tolist()
         print(f"To node {target}: path = {path}, distance = {distance_vector[target]}")
     return distance_vector
 
-shortest_distances = dijkstra(matrix, distance_vector)
+# Binary heap on two preallocated parallel arrays (distances + vertices) so
+# the whole loop compiles with numba, no Python objects involved.
+@njit(cache=True)
+def _heap_push(heap_d, heap_v, size, d, v):
+    heap_d[size] = d
+    heap_v[size] = v
+    i = size
+    while i > 0:
+        parent = (i - 1) // 2
+        if heap_d[i] < heap_d[parent]:
+            heap_d[i], heap_d[parent] = heap_d[parent], heap_d[i]
+            heap_v[i], heap_v[parent] = heap_v[parent], heap_v[i]
+            i = parent
+        else:
+            break
+    return size + 1
+
+@njit(cache=True)
+def _heap_pop(heap_d, heap_v, size):
+    d = heap_d[0]
+    v = heap_v[0]
+    size -= 1
+    heap_d[0] = heap_d[size]
+    heap_v[0] = heap_v[size]
+    i = 0
+    while True:
+        left = 2 * i + 1
+        right = left + 1
+        smallest = i
+        if left < size and heap_d[left] < heap_d[smallest]:
+            smallest = left
+        if right < size and heap_d[right] < heap_d[smallest]:
+            smallest = right
+        if smallest == i:
+            break
+        heap_d[i], heap_d[smallest] = heap_d[smallest], heap_d[i]
+        heap_v[i], heap_v[smallest] = heap_v[smallest], heap_v[i]
+        i = smallest
+    return d, v, size
+
+@njit(cache=True)
+def _dijkstra_csr_into(indptr, indices, weights, src, dists, prev, visited, heap_d, heap_v):
+    # Fills caller-owned buffers so repeated solves (all-pairs, centrality)
+    # reset with fills instead of reallocating per source.
+    dists[:] = np.inf
+    prev[:] = -1
+    visited[:] = 0
+    size = 0
+
+    dists[src] = 0.0
+    size = _heap_push(heap_d, heap_v, size, 0.0, src)
+
+    while size > 0:
+        d, u, size = _heap_pop(heap_d, heap_v, size)
+        if visited[u]:
+            continue
+        visited[u] = 1
+        for k in range(indptr[u], indptr[u + 1]):
+            v = indices[k]
+            if visited[v]:
+                continue
+            alt = d + weights[k]
+            if alt < dists[v]:
+                dists[v] = alt
+                prev[v] = u
+                size = _heap_push(heap_d, heap_v, size, alt, v)
+
+@njit(cache=True)
+def _dijkstra_csr(indptr, indices, weights, n, src):
+    dists = np.empty(n)
+    prev = np.empty(n, dtype=np.int32)
+    visited = np.empty(n, dtype=np.uint8)
+    heap_d = np.empty(2 * indices.shape[0] + 1)
+    heap_v = np.empty(2 * indices.shape[0] + 1, dtype=np.int32)
+    _dijkstra_csr_into(indptr, indices, weights, src, dists, prev, visited, heap_d, heap_v)
+    return dists, prev
+
+@njit(cache=True, parallel=True)
+def apsp_parallel(indptr, indices, weights, n):
+    # Embarrassingly parallel all-pairs: one serial dijkstra per source,
+    # sources spread over the cores by prange. Each iteration allocates its
+    # own scratch inside _dijkstra_csr, so the threads share nothing but the
+    # read-only CSR arrays.
+    D = np.empty((n, n))
+    P = np.empty((n, n), dtype=np.int32)
+    for s in prange(n):
+        dists, prev = _dijkstra_csr(indptr, indices, weights, n, s)
+        D[s] = dists
+        P[s] = prev
+    return D, P
+
+class DijkstraSolver:
+    # Owns the distance/predecessor/visited/heap buffers for repeated
+    # single-source solves on one graph, so n calls cost n kernel runs and
+    # zero python-side allocations.
+    def __init__(self, indptr, indices, weights):
+        self.indptr = indptr
+        self.indices = indices
+        self.weights = weights
+        self.n = indptr.shape[0] - 1
+        self.dist = np.empty(self.n)
+        self.prev = np.empty(self.n, dtype=np.int32)
+        self.visited = np.empty(self.n, dtype=np.uint8)
+        self.heap_d = np.empty(2 * indices.shape[0] + 1)
+        self.heap_v = np.empty(2 * indices.shape[0] + 1, dtype=np.int32)
+
+    def solve(self, src=0):
+        _dijkstra_csr_into(self.indptr, self.indices, self.weights, src,
+                           self.dist, self.prev, self.visited,
+                           self.heap_d, self.heap_v)
+        return self.dist, self.prev
+
+def dijkstra_numba(indptr, indices, weights, n, src=0):
+    # Only the numeric core is compiled; printing and path reconstruction
+    # stay in Python.
+    dists, prev = _dijkstra_csr(indptr, indices, weights, n, src)
+
+    print(f"\nShortest paths from node {src} (compiled kernel):")
+    paths = reconstruct_paths(prev)
+    for target in range(n):
+        if dists[target] == np.inf:
+            print(f"Node {target} is unreachable from node {src}")
+            continue
+
+        path = paths[target][paths[target] != -1][::-1].tolist()
+        print(f"To node {target}: path = {path}, distance = {dists[target]}")
+    return dists, prev
+
+def dijkstra_dense(matrix, src=0, xp=np):
+    # Whole-array formulation for dense graphs: each iteration settles the
+    # closest unvisited vertex with an argmin over the distance vector, then
+    # relaxes all of its out-edges in one vectorized sweep. Every step is a
+    # single array call over length-n buffers rather than a python loop, and
+    # the same code runs on the GPU by passing xp=cupy.
+    dense = xp.array(matrix, dtype=xp.float64)
+    dense[dense == 0] = xp.inf  # 0 means "no edge" in the adjacency matrix
+    n = dense.shape[0]
+    dist = xp.full(n, xp.inf)
+    prev = xp.full(n, -1, dtype=xp.int32)
+    visited = xp.zeros(n, dtype=bool)
+    dist[src] = 0.0
+
+    for _ in range(n):
+        masked = xp.where(visited, xp.inf, dist)
+        u = int(xp.argmin(masked))
+        if masked[u] == xp.inf:
+            break  # the remaining vertices are unreachable
+        row = dense[u]
+        cand = dist[u] + row
+        upd = (row != xp.inf) & (cand < dist)
+        prev[upd] = u
+        dist[upd] = cand[upd]
+        visited[u] = True
+    return dist, prev
+
+def dijkstra_dense_gpu(matrix, src=0):
+    # Runs the vectorized kernel on-device. Pointless for the n=8 toy graph,
+    # but every per-iteration op is parallel across vertices, so the same
+    # code scales to large n on CUDA cores unchanged.
+    if cp is None:
+        raise ImportError("cupy is not installed, GPU version unavailable")
+    dist, prev = dijkstra_dense(matrix, src, xp=cp)
+    return cp.asnumpy(dist), cp.asnumpy(prev)
+
+def reconstruct_paths(prev):
+    # Walk every target back towards the source at once: column d holds the
+    # d-th ancestor of each target, advanced with one gather per depth level.
+    # O(diameter) array ops instead of one python walk per target; rows are
+    # source-last, strip the -1 padding and reverse at print time.
+    n = prev.shape[0]
+    paths = np.full((n, n), -1, dtype=np.int32)
+    cur = np.arange(n, dtype=np.int32)
+    for d in range(n):
+        active = cur != -1
+        if not active.any():
+            break
+        paths[active, d] = cur[active]
+        cur = np.where(active, prev[cur], -1)
+    return paths
+
+def minplus(A, B):
+    # Tropical (min-plus) matrix product: C[i, j] = min over k of A[i, k] + B[k, j].
+    return (A[:, :, None] + B[None, :, :]).min(axis=1)
+
+def all_pairs_tropical(matrix, xp=np):
+    # Shortest paths form a closed semiring, so squaring the weight matrix in
+    # (min, +) doubles the maximum path length covered: ceil(log2(n)) bulk
+    # array passes give all-pairs distances instead of n dijkstra runs, and
+    # with xp=cupy the whole thing is a few GPU launches.
+    D = xp.array(matrix, dtype=xp.float64)
+    D[D == 0] = xp.inf  # 0 means "no edge" in the adjacency matrix
+    n = D.shape[0]
+    D[xp.arange(n), xp.arange(n)] = 0.0
+    for _ in range(max(1, int(np.ceil(np.log2(n))))):
+        D = minplus(D, D)
+    return D
+
+shortest_distances = dijkstra(indptr, indices, weights, distance_vector)
 print("\nFinal shortest distances from source vertex 0:")
 print(shortest_distances)
 
-G = nx.MultiDiGraph()
-G.add_weighted_edges_from(edges)
-labels = nx.get_edge_attributes(G, "weight")
-pos = nx.shell_layout(G)
-nx.draw(G, pos, with_labels=True, connectionstyle='arc3, rad = 0.2', node_size = 1000, node_color = 'red')
-nx.draw_networkx_edge_labels(G, pos, edge_labels=labels, connectionstyle='arc3, rad = 0.2')
-plt.show()
+numba_distances, numba_previous = dijkstra_numba(indptr, indices, weights, n)
+print("\nCompiled kernel agrees with the python loop:", np.allclose(numba_distances, shortest_distances))
+
+# Reference result from scipy's Cython implementation, fed the same CSR data.
+edge_array = np.asarray(edges, dtype=np.float64)
+csr = csr_matrix((edge_array[:, 2], (edge_array[:, 0].astype(np.int32), edge_array[:, 1].astype(np.int32))), shape=(n, n))
+scipy_distances, scipy_previous = sp_dijkstra(csr, indices=0, return_predecessors=True)
+print("\nscipy.sparse.csgraph distances from node 0:")
+print(scipy_distances)
+print("scipy agrees with the python loop:", np.allclose(scipy_distances, shortest_distances))
+
+dense_distances, dense_previous = dijkstra_dense(matrix)
+print("Vectorized dense version agrees with the python loop:", np.allclose(dense_distances, shortest_distances))
+
+if cp is not None:
+    gpu_distances, gpu_previous = dijkstra_dense_gpu(matrix)
+    print("GPU dense version agrees with the python loop:", np.allclose(gpu_distances, shortest_distances))
+
+solver = DijkstraSolver(indptr, indices, weights)
+solver_distances, solver_previous = solver.solve(0)
+print("Reusable-buffer solver agrees with the python loop:", np.allclose(solver_distances, shortest_distances))
+
+# When the source is not fixed to 0 it is cheaper to answer every query at
+# once: all-pairs distances by tropical matrix squaring.
+all_pairs = all_pairs_tropical(matrix)
+print("\nAll-pairs distances (min-plus squaring):")
+print(all_pairs)
+print("Row 0 agrees with the python loop:", np.allclose(all_pairs[0], shortest_distances))
+
+apsp_distances, apsp_previous = apsp_parallel(indptr, indices, weights, n)
+print("Parallel all-pairs agrees with min-plus squaring:", np.allclose(apsp_distances, all_pairs))
+
+def visualize(edges):
+    # Drawing is for interactive runs only: building the networkx graph
+    # allocates a dict per edge and would pollute any timing of the solvers
+    # above. DiGraph is enough, the matrix holds at most one edge per
+    # direction.
+    G = nx.DiGraph()
+    G.add_weighted_edges_from(edges)
+    labels = nx.get_edge_attributes(G, "weight")
+    pos = nx.shell_layout(G)
+    nx.draw(G, pos, with_labels=True, connectionstyle='arc3, rad = 0.2', node_size = 1000, node_color = 'red')
+    nx.draw_networkx_edge_labels(G, pos, edge_labels=labels, connectionstyle='arc3, rad = 0.2')
+    plt.show()
+
+if __name__ == "__main__":
+    visualize(edges)
 
@@ -0,0 +1,55 @@
+import numpy as np
+import matplotlib.pyplot as plt
+from itertools import combinations
+
+# Feasible region of a 6-variable linear program shown as 2d slices: for each
+# pair of free variables (i, j) the other four are pinned to x_fixed and the
+# halfspaces A x >= b are evaluated over a grid of the free pair.
+
+N = 400
+
+# float32 everywhere: the plot only needs a handful of significant digits and
+# halving the element size doubles the SIMD lane count and halves the memory
+# traffic of the N x N x m broadcast below.
+
+# Constraints A x >= b over x1..x6
+A = np.array([
+    [1.0, 2.0, 0.5, 0.0, 1.0, 0.0],
+    [2.0, 1.0, 0.0, 1.5, 0.0, 0.5],
+    [0.0, 1.0, 1.0, 0.0, 2.0, 1.0],
+    [1.0, 0.0, 0.0, 2.0, 0.5, 1.0],
+    [-1.0, -1.0, -1.0, -1.0, -1.0, -1.0],  # x1 + ... + x6 <= 20
+], dtype=np.float32)
+b = np.array([4.0, 5.0, 3.0, 4.0, -20.0], dtype=np.float32)
+
+x_fixed = np.array([2.0, 2.0, 2.0, 2.0, 2.0, 2.0], dtype=np.float32)
+
+x_vals = np.linspace(0.0, 10.0, N, dtype=np.float32)
+X, Y = np.meshgrid(x_vals, x_vals)
+
+def feasibility_slice(i, j):
+    # Contribution of the pinned variables to every constraint, then a single
+    # broadcast over the grid: Z[k] holds constraint k evaluated at each cell,
+    # so all m halfspaces are checked in one vectorized sweep instead of a
+    # python loop allocating an N x N array per constraint.
+    x_rest = x_fixed.copy()
+    x_rest[[i, j]] = 0.0
+    consts = A @ x_rest
+    Z = A[:, i, None, None] * X + A[:, j, None, None] * Y + consts[:, None, None]
+    feasible = np.all(Z >= b[:, None, None], axis=0)
+    return Z, feasible
+
+fig, axes = plt.subplots(3, 5, figsize=(22, 12))
+for ax, (i, j) in zip(axes.ravel(), combinations(range(6), 2)):
+    Z, feasible = feasibility_slice(i, j)
+    ax.imshow(feasible, origin='lower', extent=(0, 10, 0, 10), cmap='Greens', alpha=0.6)
+    # Constraint boundaries come from the already-computed stack, the drawing
+    # loop does no numeric work
+    for k in range(A.shape[0]):
+        ax.contour(X, Y, Z[k] - b[k], levels=[0.0], linewidths=0.8)
+    ax.set_xlabel(f"x{i+1}")
+    ax.set_ylabel(f"x{j+1}")
+
+fig.suptitle("2d slices of the 6-dimensional feasible region")
+plt.tight_layout()
+plt.show()